@@ -122,7 +122,7 @@ if __name__ == '__main__':
     logger.info(f"Output directory: {output_path}")
     params = get_params(args)
     logger.info(f"Parameters: {params}")
-    DDBinfo = DDBScalingInfo()
+    DDBinfo = DDBScalingInfo(params['max_concurrent_tasks'])
     dynamo_tables_result = DDBinfo.get_all_dynamodb_autoscaling_settings_with_indexes(
         params['dynamodb_tablename'], params['max_concurrent_tasks'])
 
@@ -3,6 +3,7 @@ from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 from tqdm import tqdm
 import boto3
+from botocore.config import Config
 import logging
 
 logging.basicConfig(level=logging.INFO)
@@ -10,9 +11,11 @@ logger = logging.getLogger(__name__)
 
 
 class DDBScalingInfo:
-    def __init__(self):
-        self.dynamodb_client = boto3.client('dynamodb')
-        self.app_autoscaling = boto3.client('application-autoscaling')
+    def __init__(self, max_concurrent_tasks: int = 10):
+        # The clients are shared by all table threads, so size their connection pools to match.
+        config = Config(max_pool_connections=max_concurrent_tasks)
+        self.dynamodb_client = boto3.client('dynamodb', config=config)
+        self.app_autoscaling = boto3.client('application-autoscaling', config=config)
 
     def get_dynamodb_autoscaling_settings(self, base_table_name: str, table_storage_class: str, index_name: str = None):
 
@@ -100,16 +103,10 @@ class DDBScalingInfo:
 
         # Get a list of all DynamoDB tables
         table_names = []
-        last_evaluated_table_name = None
         if not table_name:
-            while last_evaluated_table_name != '':
-                params = {}
-                if last_evaluated_table_name:
-                    params['ExclusiveStartTableName'] = last_evaluated_table_name
-                response = dynamodb_client.list_tables(**params)
+            paginator = dynamodb_client.get_paginator('list_tables')
+            for response in paginator.paginate():
                 table_names += response['TableNames']
-                last_evaluated_table_name = response.get(
-                    'LastEvaluatedTableName', '')
 
         else:
             table_names = [table_name]
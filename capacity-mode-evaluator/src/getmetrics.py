@@ -2,6 +2,7 @@ import datetime
 from datetime import datetime, timedelta
 from queue import Queue
 import boto3
+from botocore.config import Config
 import src.metrics_estimates as estimates
 import pandas as pd
 from tqdm.contrib.concurrent import thread_map
@@ -54,74 +55,48 @@ def process_results(metrics_list, metric, metric_result_queue, estimate_result_q
     estimate_result_queue.put(estimate_units)
 
 
-def fetch_metric_data(metric, start_time, end_time, consumed_period, provisioned_period):
-    cw = boto3.client('cloudwatch')
-
-    if metric['MetricName'] == 'ProvisionedWriteCapacityUnits':
-        result = cw.get_metric_data(MetricDataQueries=[
-            {
-                'Id': 'provisioned_rcu',
-                'MetricStat': {
-                    'Metric': {
-                        'Namespace': 'AWS/DynamoDB',
-                        'MetricName': 'ProvisionedReadCapacityUnits',
-                        'Dimensions': metric['Dimensions']
-                    },
-                    'Period': provisioned_period,
-                    'Stat': 'Average'
-                },
+def metric_data_query(query_id, metric_name, dimensions, period, stat):
+    return {
+        'Id': query_id,
+        'MetricStat': {
+            'Metric': {
+                'Namespace': 'AWS/DynamoDB',
+                'MetricName': metric_name,
+                'Dimensions': dimensions
             },
-            {
-                'Id': 'provisioned_wcu',
-                'MetricStat': {
-                    'Metric': {
-                        'Namespace': 'AWS/DynamoDB',
-                        'MetricName': 'ProvisionedWriteCapacityUnits',
-                        'Dimensions': metric['Dimensions']
-                    },
-                    'Period': provisioned_period,
-                    'Stat': 'Average'
-                }
-            }
-        ], StartTime=start_time, EndTime=end_time)
-        return (result, metric['Dimensions'])
+            'Period': period,
+            'Stat': stat
+        },
+    }
+
 
+def fetch_metric_data(cw, metric, start_time, end_time, consumed_period, provisioned_period):
+    # The read and write metrics of a table or index are fetched together, once
+    # for its provisioned capacity and once for its consumed capacity.
+    if metric['MetricName'] == 'ProvisionedWriteCapacityUnits':
+        kind, period, stat = 'provisioned', provisioned_period, 'Average'
     elif metric['MetricName'] == 'ConsumedReadCapacityUnits':
-        result = cw.get_metric_data(MetricDataQueries=[
-            {
-                'Id': 'consumed_rcu',
-                'MetricStat': {
-                    'Metric': {
-                        'Namespace': 'AWS/DynamoDB',
-                        'MetricName': 'ConsumedReadCapacityUnits',
-                        'Dimensions': metric['Dimensions']
-                    },
-                    'Period': consumed_period,
-                    'Stat': 'Sum'
-                },
-            },
-            {
-                'Id': 'consumed_wcu',
-                'MetricStat': {
-                    'Metric': {
-                        'Namespace': 'AWS/DynamoDB',
-                        'MetricName': 'ConsumedWriteCapacityUnits',
-                        'Dimensions': metric['Dimensions']
-                    },
-                    'Period': consumed_period,
-                    'Stat': 'Sum'
-                }
-            }
-        ], StartTime=start_time, EndTime=end_time)
-        return (result, metric['Dimensions'])
-
-    return None
+        kind, period, stat = 'consumed', consumed_period, 'Sum'
+    else:
+        return None
+
+    result = cw.get_metric_data(MetricDataQueries=[
+        metric_data_query(f'{kind}_rcu', f'{kind.capitalize()}ReadCapacityUnits',
+                          metric['Dimensions'], period, stat),
+        metric_data_query(f'{kind}_wcu', f'{kind.capitalize()}WriteCapacityUnits',
+                          metric['Dimensions'], period, stat)
+    ], StartTime=start_time, EndTime=end_time)
+    return (result, metric['Dimensions'])
 
 
 def get_table_metrics(metrics, start_time, end_time, consumed_period, provisioned_period, read_utilization, write_utilization, read_min, write_min, read_max, write_max, max_concurrent_tasks,dynamodb_tablename):
     metric_result_queue = Queue()
     estimate_result_queue = Queue()
-    metric_data_list = thread_map(lambda metric: fetch_metric_data(metric, start_time, end_time, consumed_period, provisioned_period),
+    # boto3 clients are thread-safe, so one client is shared by all fetch threads,
+    # with a connection pool large enough for all of them.
+    cw = boto3.client('cloudwatch', config=Config(
+        max_pool_connections=max_concurrent_tasks))
+    metric_data_list = thread_map(lambda metric: fetch_metric_data(cw, metric, start_time, end_time, consumed_period, provisioned_period),
                                   metrics, max_workers=max_concurrent_tasks, desc="Fetching CloudWatch metrics for: " + dynamodb_tablename)
 
     metric_data_list = [
@@ -1,4 +1,7 @@
 import pandas as pd
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from collections import deque
 from datetime import datetime, timedelta, date
 
 
@@ -10,8 +13,23 @@ def min_a(i, j):
     return j if i > j else i
 
 
-def decrease(L):
-    return any(x > y for x, y in zip(L, L[1:]))
+def push_window(window, value, decreases):
+    # Append value to a bounded window and return how many adjacent pairs in it now decrease.
+    if len(window) == window.maxlen and window[0] > window[1]:
+        decreases -= 1
+    if window and window[-1] > value:
+        decreases += 1
+    window.append(value)
+    return decreases
+
+
+def window_units(records, size, utilization):
+    # Units needed at `utilization` for the max and min consumed units of every window of `size` records,
+    # indexed by window start.
+    if len(records) < size:
+        return [], []
+    windows = sliding_window_view(np.array([v[4] for v in records], dtype=np.float64), size)
+    return ((windows.max(axis=1) / utilization) * 100).tolist(), ((windows.min(axis=1) / utilization) * 100).tolist()
 
 
 def estimate_units(read, write, read_utilization, write_utilization, read_min, write_min, read_max, write_max):
@@ -20,26 +38,44 @@ def estimate_units(read, write, read_utilization, write_utilization, read_min, w
         smallest_list = read
     else:
         smallest_list = write
-    final_read_cu = []
 
     # Scale-in threshold = 20% percent to prevent small fluctuations in capacity usage from triggering unnecessary scale-ins.
     scale_in_threshold = 1.20
     count = 0
     last_change = "read"
-    final_write_cu = []
-    prev_read = read[0]
-    prev_write = write[0]
-    final_write_cu += [prev_write]
-    final_read_cu += [prev_read]
-    prev_read[5] = min(max((prev_read[4] / read_utilization)
-                      * 100, read_min), read_max)
-    prev_write[5] = min(max((prev_write[4] / write_utilization)
-                       * 100, write_min), write_max)
+    # Estimated units are kept in their own lists and written back to the records after the simulation.
+    # They start filled with the first estimate, which the next two records reuse as is.
+    prev_read = min(max((read[0][4] / read_utilization)
+                        * 100, read_min), read_max)
+    prev_write = min(max((write[0][4] / write_utilization)
+                         * 100, write_min), write_max)
+    read_estimates = [prev_read] * len(smallest_list)
+    write_estimates = [prev_write] * len(smallest_list)
+    # Consumed units do not depend on the simulation, so their windows are computed up front.
+    last2_max_reads, last2_min_reads = window_units(read, 2, read_utilization)
+    last2_max_writes, last2_min_writes = window_units(write, 2, write_utilization)
+    last15_max_reads = window_units(read, 15, read_utilization)[0]
+    last15_max_writes = window_units(write, 15, write_utilization)[0]
+    # Rolling windows over the previous estimates, with a running count of decreases in each one.
+    last15_read2 = deque(maxlen=15)
+    last15_write2 = deque(maxlen=15)
+    last60_read = deque(maxlen=60)
+    last60_write = deque(maxlen=60)
+    last15_read_decreases = last15_write_decreases = 0
+    last60_read_decreases = last60_write_decreases = 0
     for i in range(1, len(smallest_list)):
-        current_read = read[i]
-        current_write = write[i]
-
-        date_time_obj = current_read[1].to_pydatetime()
+        current_read = read[i][5]
+        current_write = write[i][5]
+        last15_read_decreases = push_window(
+            last15_read2, read_estimates[i - 1], last15_read_decreases)
+        last15_write_decreases = push_window(
+            last15_write2, write_estimates[i - 1], last15_write_decreases)
+        last60_read_decreases = push_window(
+            last60_read, read_estimates[i - 1], last60_read_decreases)
+        last60_write_decreases = push_window(
+            last60_write, write_estimates[i - 1], last60_write_decreases)
+
+        date_time_obj = read[i][1].to_pydatetime()
         midnight = date_time_obj.replace(hour=0, minute=0, second=0)
         if date_time_obj == midnight:
             count = 0
@@ -47,113 +83,94 @@ def estimate_units(read, write, read_utilization, write_utilization, read_min, w
         # compare with prev val
 
         if i <= 2:
-            current_read[5] = prev_read[5]
-            current_write[5] = prev_write[5]
-            final_read_cu += [current_read]
-            final_write_cu += [current_write]
             continue
-        # creating a list with last 2 records.
-        last2_read = [v[4] for v in list(read[i - 2: i])]
-        last2_write = [v[4] for v in list(write[i - 2: i])]
-
-        last2_max_read = max(last2_read)
-        last2_max_write = max(last2_write)
-        last2_min_read = min(last2_read)
-        last2_min_write = min(last2_write)
-        max_vread = min(max_a((last2_min_read / read_utilization)
-                            * 100, prev_read[5]), read_max)
-
-        max_vwrite = min(max_a((last2_min_write / write_utilization)
-                             * 100, prev_write[5]), write_max)
+
+        last2_max_read = last2_max_reads[i - 2]
+        last2_max_write = last2_max_writes[i - 2]
+        last2_min_read = last2_min_reads[i - 2]
+        last2_min_write = last2_min_writes[i - 2]
+        max_vread = min(max_a(last2_min_read, prev_read), read_max)
+
+        max_vwrite = min(max_a(last2_min_write, prev_write), write_max)
         # scale out based on last 2 min Units.
 
-        if current_read[0] == 'ConsumedReadCapacityUnits':
-            if max_vread == (last2_min_read / read_utilization) * 100:
+        if read[i][0] == 'ConsumedReadCapacityUnits':
+            if max_vread == last2_min_read:
 
-                current_read[5] = (last2_max_read / read_utilization) * 100
+                current_read = last2_max_read
 
             else:
 
-                current_read[5] = max_vread
+                current_read = max_vread
 
-        if current_write[0] == 'ConsumedWriteCapacityUnits':
-            if max_vwrite == (last2_min_write / write_utilization) * 100:
+        if write[i][0] == 'ConsumedWriteCapacityUnits':
+            if max_vwrite == last2_min_write:
 
-                current_write[5] = (last2_max_write / write_utilization) * 100
+                current_write = last2_max_write
             else:
 
-                current_write[5] = max_vwrite
+                current_write = max_vwrite
 
         if i <= 14:
             prev_read = current_read
-            final_read_cu += [current_read]
+            read_estimates[i] = current_read
             prev_write = current_write
-            final_write_cu += [current_write]
+            write_estimates[i] = current_write
             continue
-        # Create list from last 15 Consumed Read Units
-        last15_read = [v[4] for v in list(read[i - 15: i])]
-        last15_read2 = [v[5] for v in list(read[i - 15: i])]
-        last15_max_read = max(last15_read)
-        # Create list from last 15 Consumed Write Units
-        last15_write = [v[4] for v in list(write[i - 15: i])]
-        last15_write2 = [v[5] for v in list(write[i - 15: i])]
-        last15_max_write = max(last15_write)
+        last15_max_read = last15_max_reads[i - 15]
+        last15_max_write = last15_max_writes[i - 15]
+        # Capacity a scale-in would move to, shared by every scale-in rule below.
+        scale_in_read = max(min_a(last15_max_read, current_read), read_min)
+        scale_in_write = max(min_a(last15_max_write, current_write), write_min)
+        can_scale_in_read = prev_read > scale_in_read * scale_in_threshold
+        can_scale_in_write = prev_write > scale_in_write * scale_in_threshold
         # Scale-in based on last 15 Consumed Units
         # First 4 scale-in operation can happen anytime during the a day, there after every once an hour
         if count < 4:
-            if not decrease(last15_read2):
-                if prev_read[5] > (max(min_a(
-                        (last15_max_read / read_utilization) * 100, current_read[5]), read_min) * scale_in_threshold):
-                    current_read[5] = max(min_a(
-                        (last15_max_read / read_utilization) * 100, current_read[5]), read_min)
-                if prev_read[5] > current_read[5]:
+            if not last15_read_decreases:
+                if can_scale_in_read:
+                    current_read = scale_in_read
+                if prev_read > current_read:
 
                     count += 1
 
-            if not decrease(last15_write2):
-                if prev_write[5] > (max(min_a(
-                        (last15_max_write / write_utilization) * 100, current_write[5]), write_min) * scale_in_threshold):
-                    current_write[5] = max(min_a(
-                        (last15_max_write / write_utilization) * 100, current_write[5]), write_min)
-                if prev_write[5] > current_write[5]:
+            if not last15_write_decreases:
+                if can_scale_in_write:
+                    current_write = scale_in_write
+                if prev_write > current_write:
                     count += 1
 
         else:
             if i >= 60:
-                # Create list from last 60 Consumed Units
-                last60_read = [v[5] for v in list(read[i - 60: i])]
-                last60_write = [v[5] for v in list(write[i - 60: i])]
                 # if Table has not scale in in past 60 minutes then scale in
-                if not decrease(last60_read) and not decrease(last60_write):
-                    if prev_read[5] > (max(
-                            min_a((last15_max_read / read_utilization) * 100, current_read[5]), read_min) * scale_in_threshold) and prev_write[5] > (max(min_a((last15_max_write / write_utilization) * 100, current_write[5]), write_min) * scale_in_threshold):
+                if not last60_read_decreases and not last60_write_decreases:
+                    if can_scale_in_read and can_scale_in_write:
                         if last_change == "write":
-                            current_read[5] = max(
-                                min_a((last15_max_read / read_utilization) * 100, current_read[5]), read_min)
+                            current_read = scale_in_read
                             last_change = "read"
                         else:
-                            current_write[5] = max(
-                                min_a((last15_max_write / write_utilization) * 100, current_write[5]), write_min)
+                            current_write = scale_in_write
                             last_change = "write"
                     else:
-                        if prev_read[5] > (max(
-                                min_a((last15_max_read / read_utilization) * 100, current_read[5]), read_min) * scale_in_threshold):
-                            current_read[5] = max(
-                                min_a((last15_max_read / read_utilization) * 100, current_read[5]), read_min)
+                        if can_scale_in_read:
+                            current_read = scale_in_read
 
-                        if prev_write[5] > (max
-                                           (min_a((last15_max_write / write_utilization) * 100, current_write[5]), write_min) * scale_in_threshold):
-                            current_write[5] = max(
-                                min_a((last15_max_write / write_utilization) * 100, current_write[5]), write_min)
+                        if can_scale_in_write:
+                            current_write = scale_in_write
 
                 else:
                     pass
 
         prev_read = current_read
         prev_write = current_write
-        final_read_cu += [current_read]
-        final_write_cu += [current_write]
-    final_list = final_write_cu + final_read_cu
+        read_estimates[i] = current_read
+        write_estimates[i] = current_write
+
+    for record, estunit in zip(read, read_estimates):
+        record[5] = estunit
+    for record, estunit in zip(write, write_estimates):
+        record[5] = estunit
+    final_list = write[:len(smallest_list)] + read[:len(smallest_list)]
     return final_list
 
 
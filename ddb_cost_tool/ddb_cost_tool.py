@@ -80,14 +80,14 @@ def main():
     try:
         args = parser.parse_args()
 
-        regions = args.regions
+        # dict.fromkeys drops repeated regions while keeping the order they were given in
+        regions = list(dict.fromkeys(args.regions))
         print(regions)
         if "all" in regions:
             REGIONS.pop(0)
             return REGIONS
         else:
-            tmp = [i for i in regions if i in REGIONS]
-            if len(tmp) == len(regions):
+            if set(regions).issubset(REGIONS):
                 return regions
             else:
                 raise argparse.ArgumentError(
@@ -98,20 +98,6 @@ def main():
         sys.exit(1)
 
 
-def get_local_files(tables):
-    """Core logic that runs the capture metrics method in parallel.
-
-    Args:
-        tables (dict): Table metadata as result of describe table and other describe* api call.
-    """
-    logger.info("Get metrics for 1 and 5 minutes")
-    pool = Pool()  # Defaults to max CPUs available
-    results = pool.map(region.capture_metrics, tables)
-    pool.close()  # Prevents any more tasks being submitted to the pool
-    pool.join()  # Waits for the worker process to exit, you need to call close() or terminate() before using join
-    return results
-
-
 def clean_env():
     """Removes the files in the output folder path"""
     try:
@@ -125,27 +111,34 @@ def clean_env():
         print(f"An error occurred while deleting the directory: {e}")
 
 
-def get_ddb_table_metrics(region_name):
-    """Obtains DynamoDB tables and its metadata for later use in the calculations
+def capture_region_metrics(region_names):
+    """Captures the metadata and the 1 and 5 minute metrics of every DynamoDB
+    table in the given regions into the output folder. The tables of every region
+    are listed in parallel, and then each table is described and its metrics
+    captured by the same pool worker.
+
+    Args:
+        region_names (list): Regions to collect the tables from
 
     Returns:
-        list: An array containing all the describe table information for all the tables
+        None: Results are written to the output folder, nothing is returned
     """
-    logger.info("Collecting DynamoDB tables metadata in {0}:".format(region_name))
-    local_tables = region.get_local_tables(region_name)
-    fn_arguments = [(i, region_name) for i in local_tables]
-
-    with Pool() as pool:
-        return pool.starmap(region.get_ddb_base_object, fn_arguments)
+    logger.info(
+        "Collecting DynamoDB tables metadata in {0}:".format(", ".join(region_names))
+    )
+    with Pool() as pool:  # Defaults to max CPUs available
+        local_tables = pool.map(region.get_local_tables, region_names)
+        fn_arguments = [
+            (table_name, region_name)
+            for region_name, tables in zip(region_names, local_tables)
+            for table_name in tables
+        ]
+        pool.starmap(region.capture_table_metrics, fn_arguments)
 
 
 if __name__ == "__main__":
     region_names = main()
-    table_metadata = []
     clean_env()
-    for region_name in region_names:
-        print(region_name)
-        table_metadata.extend(get_ddb_table_metrics(region_name))
-    get_local_files(table_metadata)
+    capture_region_metrics(region_names)
 
     sys.exit(0)
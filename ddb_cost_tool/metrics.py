@@ -18,6 +18,7 @@ import json
 import logging
 import os
 from datetime import datetime, timedelta
+from functools import lru_cache
 
 import boto3
 import pandas as pd
@@ -70,11 +71,14 @@ def format_metric_query(  # pylint: disable=dangerous-default-value
     return metric_data_query
 
 
+@lru_cache(maxsize=None)
 def get_metrics_file():
+    """Reads the metrics configuration once per process; every later call
+    returns the same tuple of metric definitions."""
     with open(METRICS_FILE, "r") as jsonfile:
         data = json.load(jsonfile)
 
-    return data["dimensionMetrics"]
+    return tuple(data["dimensionMetrics"])
 
 
 def get_local_metric_data(  # pylint: disable=too-many-arguments, inconsistent-return-statements
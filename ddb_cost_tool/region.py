@@ -22,6 +22,7 @@ import logging
 import os
 import subprocess
 from datetime import date, datetime
+from functools import lru_cache
 
 import boto3
 from botocore.config import Config
@@ -34,16 +35,20 @@ log = logging.StreamHandler()
 logger.addHandler(log)
 
 
+@lru_cache(maxsize=None)
 def create_ddb_client(region):
-    """Creates a client for the specified region"""
-    my_config = Config(region_name=region)
+    """Creates a client for the specified region, reused by every later call
+    for that region in the same process"""
+    my_config = Config(region_name=region, tcp_keepalive=True)
     ddb_client = boto3.client("dynamodb", config=my_config)
     return ddb_client
 
 
+@lru_cache(maxsize=None)
 def create_cw_client(region):
-    """Creates a client for the specified region"""
-    my_config = Config(region_name=region)
+    """Creates a client for the specified region, reused by every later call
+    for that region in the same process"""
+    my_config = Config(region_name=region, tcp_keepalive=True)
     cw_client = boto3.client("cloudwatch", config=my_config)
     return cw_client
 
@@ -79,12 +84,8 @@ def get_local_tables(region) -> list:
     try:
         ddb_client = create_ddb_client(region)
         tables = []
-        response = ddb_client.list_tables()
-        tables += response["TableNames"]
-        while "LastEvaluatedTableName" in response:
-            response = ddb_client.list_tables(
-                ExclusiveStartTableName=response["LastEvaluatedTableName"]
-            )
+        paginator = ddb_client.get_paginator("list_tables")
+        for response in paginator.paginate():
             tables += response["TableNames"]
         logger.debug("Found %s tables", len(tables))
         logger.debug(tables)
@@ -263,3 +264,18 @@ def capture_metrics(table):
         stderr=subprocess.STDOUT,
     )
     logger.info("Finished processing table %s", table_id)
+
+
+def capture_table_metrics(table_name, region):
+    """Describes a table and captures its metrics in the same process, so the
+    table description is never buffered or sent back to the parent process.
+
+    Args:
+        table_name (str): DynamoDB table name
+        region (str): Region of the table
+    """
+    table = get_ddb_base_object(table_name, region)
+    if table is None:
+        logger.error("Skipping metrics for table %s", table_name)
+        return
+    capture_metrics(table)
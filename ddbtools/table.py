@@ -171,20 +171,14 @@ class TableUtility(object):
         if table_names is None:
             table_names = []
 
-        response = None
-
-        if not start_table_name:
-            response = self.dynamodb_client.list_tables()
-
-        else:
-            # if there are more than 100 table names returned, recurse to get a new page of table names
-            response = self.dynamodb_client.list_tables(ExclusiveStartTableName=start_table_name)
-        
-        paginated_table_names = response['TableNames']
-        table_names.extend(paginated_table_names)
-
-        if 'LastEvaluatedTableName' in response:
-            self.get_table_names(start_table_name=response['LastEvaluatedTableName'], table_names=table_names)
+        params = {}
+        if start_table_name:
+            params['ExclusiveStartTableName'] = start_table_name
+
+        # the paginator follows LastEvaluatedTableName, 100 table names per page
+        paginator = self.dynamodb_client.get_paginator('list_tables')
+        for response in paginator.paginate(**params):
+            table_names.extend(response['TableNames'])
 
         return table_names
 
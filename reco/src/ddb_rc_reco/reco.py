@@ -1,5 +1,3 @@
-import time
-import queue
 import logging
 import re
 import copy
@@ -308,34 +306,28 @@ def make_a_wish(region_hours, years):
         p.start()
 
 
-    waiting_regions.join()
+    # Every region reports back exactly once, so block on the results instead of sleeping.
+    for region in regions:
+        completed_region = completed_regions.get()
+        is_my_command[completed_region[0]] = completed_region[1]
     for cpus in range(cpu_count):
         waiting_regions.put('STOP')
-    time.sleep(2)
     for p in processes:
-        p.terminate()
-    while not completed_regions.empty():
-        completed_region =  completed_regions.get()
-        is_my_command[completed_region[0]] = completed_region[1]
+        p.join()
     return is_my_command
 
 def wish_process(waiting_regions, completed_regions):
     while True:
-        try:
-            logger.debug("Attempting to grab a region off the queue.")
-            working_region = waiting_regions.get_nowait()
-            if isinstance(working_region, str) and working_region == 'STOP':
-                logger.debug("Received STOP. This thread is ending.")
-                break
-            logger.debug("Processing {}".format(working_region[0]))
-            completed_region = _make_a_wish(working_region[0], working_region[1], working_region[2])
-            waiting_regions.task_done()
-        except queue.Empty:
-            logger.debug("wish_process - Queue is empty. Sleeping 1s.")
-            time.sleep(1)
-        else:
-            logger.debug("Putting {} into completed regions".format(working_region[0]))
-            completed_regions.put([working_region[0], completed_region])
+        logger.debug("Waiting for a region on the queue.")
+        working_region = waiting_regions.get()
+        if isinstance(working_region, str) and working_region == 'STOP':
+            logger.debug("Received STOP. This thread is ending.")
+            break
+        logger.debug("Processing {}".format(working_region[0]))
+        completed_region = _make_a_wish(working_region[0], working_region[1], working_region[2])
+        waiting_regions.task_done()
+        logger.debug("Putting {} into completed regions".format(working_region[0]))
+        completed_regions.put([working_region[0], completed_region])
 
 
 